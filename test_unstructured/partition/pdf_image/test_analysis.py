@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 from PIL import Image
@@ -6,12 +8,16 @@ from unstructured_inference.inference.layout import DocumentLayout, PageLayout
 from unstructured_inference.inference.layoutelement import LayoutElement
 
 from unstructured.partition.pdf_image.analysis.bbox_visualisation import (
+    AnalysisDrawer,
     TextAlignment,
     get_bbox_text_size,
     get_bbox_thickness,
+    get_font,
     get_label_rect_and_coords,
+    get_pdf_render_thread_count,
     get_rgb_color,
     get_text_color,
+    get_truetype_font,
 )
 from unstructured.partition.pdf_image.analysis.layout_dump import ObjectDetectionLayoutDumper
 
@@ -26,6 +32,38 @@ def test_get_rgb_color(color: str):
     assert all(0 <= c <= 255 for c in color_tuple)
 
 
+def test_get_font_scans_system_fonts_only_once():
+    get_font.cache_clear()
+    with patch(
+        "unstructured.partition.pdf_image.analysis.bbox_visualisation.font_manager.findSystemFonts",
+        return_value=["/fonts/DejaVuSans.ttf", "/fonts/Arial.ttf"],
+    ) as mock_find_system_fonts:
+        assert get_font() == "/fonts/Arial.ttf"
+        assert get_font() == "/fonts/Arial.ttf"
+    get_font.cache_clear()
+
+    mock_find_system_fonts.assert_called_once()
+
+
+def test_get_truetype_font_reuses_loaded_font():
+    assert get_truetype_font(17) is get_truetype_font(17)
+    assert get_truetype_font(17).size == 17
+    assert get_truetype_font(21).size == 21
+
+
+def test_get_rgb_color_converts_each_color_name_only_once():
+    get_rgb_color.cache_clear()
+    with patch(
+        "unstructured.partition.pdf_image.analysis.bbox_visualisation.colors.to_rgb",
+        return_value=(1.0, 0.0, 0.0),
+    ) as mock_to_rgb:
+        assert get_rgb_color("red") == (255, 0, 0)
+        assert get_rgb_color("red") == (255, 0, 0)
+    get_rgb_color.cache_clear()
+
+    mock_to_rgb.assert_called_once_with("red")
+
+
 @pytest.mark.parametrize(
     ("bbox", "expected_text_size"),
     [
@@ -80,6 +118,40 @@ def test_best_text_color(color, expected_text_color):
     assert text_color_tuple == expected_text_color_tuple
 
 
+@pytest.mark.parametrize(
+    ("image_format", "expected_save_params"),
+    [
+        ("png", {"compress_level": 1}),
+        ("PNG", {"compress_level": 1}),
+        ("jpg", {"optimize": True, "quality": 85}),
+    ],
+)
+def test_analysis_drawer_save_params(tmp_path, image_format: str, expected_save_params: dict):
+    drawer = AnalysisDrawer(
+        filename="example.pdf", is_image=False, save_dir=tmp_path, format=image_format
+    )
+
+    assert drawer.save_params == expected_save_params
+
+
+@pytest.mark.parametrize(
+    ("available_cpus", "expected_thread_count"), [(1, 1), (4, 4), (8, 8), (64, 8)]
+)
+def test_get_pdf_render_thread_count_uses_available_cpus(available_cpus, expected_thread_count):
+    with (
+        patch(
+            "unstructured.partition.pdf_image.analysis.bbox_visualisation.os.sched_getaffinity",
+            return_value=set(range(available_cpus)),
+            create=True,
+        ),
+        patch(
+            "unstructured.partition.pdf_image.analysis.bbox_visualisation.os.cpu_count",
+            return_value=128,
+        ),
+    ):
+        assert get_pdf_render_thread_count() == expected_thread_count
+
+
 @pytest.mark.parametrize(
     ("alignment", "expected_text_bbox"),
     [
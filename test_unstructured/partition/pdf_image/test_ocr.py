@@ -269,6 +269,20 @@ def test_get_layout_elements_from_image_google_vision(google_vision_client):
     assert len(layout_elements) == 1
 
 
+def test_get_layout_elements_from_image_google_vision_calls_api_once(google_vision_client):
+    image = Image.new("RGB", (100, 100))
+    ocr_agent = google_vision_client
+
+    with patch.object(
+        ocr_agent.client,
+        "document_text_detection",
+        wraps=ocr_agent.client.document_text_detection,
+    ) as mock_detection:
+        ocr_agent.get_layout_elements_from_image(image)
+
+    mock_detection.assert_called_once()
+
+
 @pytest.fixture()
 def mock_ocr_regions():
     return [
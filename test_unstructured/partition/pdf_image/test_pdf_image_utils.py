@@ -61,6 +61,24 @@ def test_convert_pdf_to_image(
             assert isinstance(images[0], PILImg.Image)
 
 
+@pytest.mark.parametrize("file_mode", ["filename", "rb"])
+def test_convert_pdf_to_image_passes_thread_count_to_pdf2image(file_mode):
+    filename = example_doc_path("pdf/embedded-images.pdf")
+    with (
+        patch.object(pdf_image_utils.pdf2image, "convert_from_path") as mock_from_path,
+        patch.object(pdf_image_utils.pdf2image, "convert_from_bytes") as mock_from_bytes,
+    ):
+        if file_mode == "filename":
+            pdf_image_utils.convert_pdf_to_image(filename=filename, thread_count=4)
+            mock_convert = mock_from_path
+        else:
+            with open(filename, "rb") as f:
+                pdf_image_utils.convert_pdf_to_image(filename="", file=f, thread_count=4)
+            mock_convert = mock_from_bytes
+
+    assert mock_convert.call_args.kwargs["thread_count"] == 4
+
+
 def test_convert_pdf_to_image_raises_error(filename=example_doc_path("embedded-images.pdf")):
     with pytest.raises(ValueError) as exc_info:
         pdf_image_utils.convert_pdf_to_image(filename=filename, path_only=True, output_folder=None)
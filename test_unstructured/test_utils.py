@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+from unittest.mock import patch
 
 import pytest
 
@@ -43,6 +44,116 @@ def test_read_as_jsonl(input_jsonl_file, input_data):
     assert file_data == input_data
 
 
+def test_read_as_jsonl_skips_blank_lines(tmp_path, input_data):
+    file_path = os.path.join(tmp_path, "input.jsonl")
+    with open(file_path, "w+") as input_file:
+        input_file.write("\n".join(json.dumps(obj) for obj in input_data) + "\n\n")
+
+    assert utils.read_from_jsonl(file_path) == input_data
+
+
+def test_save_as_jsonl_round_trips(input_data, output_jsonl_file):
+    utils.save_as_jsonl(input_data, output_jsonl_file)
+    assert utils.read_from_jsonl(output_jsonl_file) == input_data
+
+
+@pytest.mark.parametrize("separator", ["\u2028", "\u2029", "\x85"])
+def test_read_as_jsonl_keeps_unicode_line_separators_in_values(tmp_path, separator: str):
+    data = [{"text": f"x{separator}y"}, {"text": "z"}]
+    file_path = os.path.join(tmp_path, "input.jsonl")
+    with open(file_path, "w+", encoding="utf-8") as input_file:
+        input_file.writelines(json.dumps(obj, ensure_ascii=False) + "\n" for obj in data)
+
+    assert utils.read_from_jsonl(file_path) == data
+
+
+class Describe_lazyproperty:
+    def it_computes_the_value_only_on_first_access(self):
+        class Obj:
+            call_count = 0
+
+            @utils.lazyproperty
+            def fget(self) -> str:
+                Obj.call_count += 1
+                return "some result"
+
+        obj = Obj()
+
+        assert obj.fget == "some result"
+        assert obj.fget == "some result"
+        assert Obj.call_count == 1
+
+    def it_caches_a_None_value(self):
+        class Obj:
+            call_count = 0
+
+            @utils.lazyproperty
+            def fget(self) -> None:
+                Obj.call_count += 1
+
+        obj = Obj()
+
+        assert obj.fget is None
+        assert obj.fget is None
+        assert Obj.call_count == 1
+
+    def it_returns_the_descriptor_when_accessed_on_the_class(self):
+        class Obj:
+            @utils.lazyproperty
+            def fget(self) -> str:
+                """Docstring of fget."""
+                return "some result"
+
+        assert isinstance(Obj.fget, utils.lazyproperty)
+        assert Obj.fget.__doc__ == "Docstring of fget."
+
+    def it_caches_under_the_name_it_is_bound_to_on_the_class(self):
+        def _compute(self: object) -> str:
+            return "some result"
+
+        class Obj:
+            fget = utils.lazyproperty(_compute)
+
+        obj = Obj()
+
+        assert obj.fget == "some result"
+        assert obj.__dict__ == {"fget": "some result"}
+
+
+@pytest.mark.parametrize("env_var", ["SCARF_NO_ANALYTICS", "DO_NOT_TRACK"])
+def test_scarf_analytics_respects_opt_out(monkeypatch: pytest.MonkeyPatch, env_var: str):
+    monkeypatch.setenv(env_var, "true")
+    with patch.object(utils.threading, "Thread") as mock_thread:
+        utils.scarf_analytics()
+
+    mock_thread.assert_not_called()
+
+
+def test_scarf_analytics_sends_from_a_daemon_thread(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("SCARF_NO_ANALYTICS", raising=False)
+    monkeypatch.delenv("DO_NOT_TRACK", raising=False)
+    with patch.object(utils.threading, "Thread") as mock_thread:
+        utils.scarf_analytics()
+
+    mock_thread.assert_called_once_with(target=utils._send_scarf_analytics, daemon=True)
+    mock_thread.return_value.start.assert_called_once_with()
+
+
+def test_send_scarf_analytics_uses_a_short_timeout():
+    with patch.object(utils.requests, "get") as mock_get:
+        utils._send_scarf_analytics()
+
+    (url,), kwargs = mock_get.call_args
+    assert url.startswith("https://packages.unstructured.io/python-telemetry?version=")
+    assert "&python=" in url
+    assert kwargs == {"timeout": 1.0}
+
+
+def test_send_scarf_analytics_swallows_errors():
+    with patch.object(utils.requests, "get", side_effect=ConnectionError):
+        utils._send_scarf_analytics()
+
+
 def test_requires_dependencies_decorator():
     @utils.requires_dependencies(dependencies="numpy")
     def test_func():
@@ -79,6 +190,18 @@ def test_requires_dependencies_decorator_import_error_multiple():
         test_func()
 
 
+def test_requires_dependencies_decorator_checks_dependencies_only_once():
+    @utils.requires_dependencies(dependencies=["numpy", "json"])
+    def test_func():
+        return True
+
+    with patch.object(utils, "dependency_exists", return_value=True) as mock_dependency_exists:
+        assert test_func()
+        assert test_func()
+
+    assert mock_dependency_exists.call_count == 2
+
+
 def test_requires_dependencies_decorator_in_class():
     @utils.requires_dependencies(dependencies="numpy")
     class TestClass:
@@ -88,12 +211,28 @@ def test_requires_dependencies_decorator_in_class():
     TestClass()
 
 
+@pytest.mark.parametrize(
+    ("dependency", "expected_value"),
+    [("json", True), ("numpy", True), ("not_a_package", False), ("not_a_package.submodule", False)],
+)
+def test_dependency_exists(dependency: str, expected_value: bool):
+    assert utils.dependency_exists(dependency) is expected_value
+
+
+def test_dependency_exists_does_not_import_the_dependency():
+    utils.dependency_exists.cache_clear()
+    with patch.object(utils.importlib, "import_module") as mock_import_module:
+        assert utils.dependency_exists("numpy") is True
+
+    mock_import_module.assert_not_called()
+
+
 @pytest.mark.parametrize("iterator", [[0, 1], (0, 1), range(10), [0], (0,), range(1)])
 def test_first_gives_first(iterator):
     assert utils.first(iterator) == 0
 
 
-@pytest.mark.parametrize("iterator", [[], ()])
+@pytest.mark.parametrize("iterator", [[], (), range(0)])
 def test_first_raises_if_empty(iterator):
     with pytest.raises(ValueError):
         utils.first(iterator)
@@ -101,7 +240,7 @@ def test_first_raises_if_empty(iterator):
 
 @pytest.mark.parametrize("iterator", [[0], (0,), range(1)])
 def test_only_gives_only(iterator):
-    assert utils.first(iterator) == 0
+    assert utils.only(iterator) == 0
 
 
 @pytest.mark.parametrize("iterator", [[0, 1], (0, 1), range(10)])
@@ -110,7 +249,7 @@ def test_only_raises_when_len_more_than_1(iterator):
         utils.only(iterator)
 
 
-@pytest.mark.parametrize("iterator", [[], ()])
+@pytest.mark.parametrize("iterator", [[], (), range(0)])
 def test_only_raises_if_empty(iterator):
     with pytest.raises(ValueError):
         utils.only(iterator)
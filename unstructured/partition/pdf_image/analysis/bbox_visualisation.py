@@ -1,5 +1,7 @@
+import functools
 import logging
 import math
+import os
 import tempfile
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -19,6 +21,7 @@ from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_imag
 PageImage = TypeVar("PageImage", Image.Image, np.ndarray)
 
 
+@functools.lru_cache(maxsize=None)
 def get_font():
     preferred_fonts = ["Arial.ttf"]
     available_fonts = font_manager.findSystemFonts()
@@ -31,6 +34,34 @@ def get_font():
     return available_fonts[0]
 
 
+@functools.lru_cache(maxsize=None)
+def get_truetype_font(font_size: int) -> ImageFont.FreeTypeFont:
+    """Load the preferred system font at the given size.
+
+    Labels are drawn for every bbox on every page but only take a handful of distinct sizes, so
+    the loaded font is cached rather than re-read from disk for each label.
+    """
+    return ImageFont.truetype(get_font(), font_size)
+
+
+# -- upper bound on poppler processes used to render pages; CPU quotas (e.g. cgroup limits in a
+# -- container) are not reflected in the CPU affinity mask, so don't rely on that alone.
+MAX_PDF_RENDER_THREADS = 8
+
+
+def get_pdf_render_thread_count() -> int:
+    """Number of poppler processes to render PDF pages with.
+
+    Uses the CPUs this process may run on (not the host CPU count) where the platform reports
+    that, capped at `MAX_PDF_RENDER_THREADS`.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        available_cpus = len(os.sched_getaffinity(0))
+    else:
+        available_cpus = os.cpu_count() or 1
+    return max(1, min(available_cpus, MAX_PDF_RENDER_THREADS))
+
+
 COLOR_WHITE = ("white", (255, 255, 255))
 COLOR_BLACK = ("black", (0, 0, 0))
 
@@ -58,9 +89,13 @@ class BBox:
     labels: Optional[BboxLabels] = None
 
 
+@functools.lru_cache(maxsize=None)
 def get_rgb_color(color: str) -> tuple[int, int, int]:
     """Convert a color name to RGB values.
 
+    The result is cached since the same handful of named colors is converted for every bbox and
+    label drawn.
+
     Args:
         color: A color name supported by matplotlib.
 
@@ -172,6 +207,7 @@ def get_bbox_thickness(
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_text_color(
     background_color: Union[str, tuple[int, int, int]], brightness_threshold: float = 0.5
 ) -> tuple[str, tuple[int, int, int]]:
@@ -277,7 +313,7 @@ def draw_bbox_label(
         font_size:          Font size of the text.
         background_color:   RGB values of the background color.
     """
-    font = ImageFont.truetype(get_font(), font_size)
+    font = get_truetype_font(font_size)
     text_x1, text_y1, text_x2, text_y2 = image_draw.textbbox(
         (0, 0), text, font=font, align="center"
     )
@@ -591,8 +627,7 @@ class AnalysisDrawer(AnalysisProcessor):
                     image.save(
                         analysis_save_dir / f"page{page_num}"
                         f"_layout_{drawer.layout_source}.{self.format}",
-                        optimize=True,
-                        quality=85,
+                        **self.save_params,
                     )
                     image.close()
                 else:
@@ -605,13 +640,24 @@ class AnalysisDrawer(AnalysisProcessor):
                     )
                 grid_image.save(
                     analysis_save_dir / f"page{page_num}_layout_all.{self.format}",
-                    optimize=True,
-                    quality=85,
+                    **self.save_params,
                 )
                 grid_image.close()
 
+    @property
+    def save_params(self) -> dict[str, Any]:
+        """Keyword arguments passed to PIL when saving the rendered page images.
+
+        These images are debugging artifacts, so PNG output uses fast, light zlib compression
+        rather than `optimize=True` (which implies the slowest compression level) in exchange for
+        somewhat larger files.
+        """
+        if self.format.lower() == "png":
+            return {"compress_level": 1}
+        return {"optimize": True, "quality": 85}
+
     def add_caption(self, image: Image.Image, caption: str):
-        font = ImageFont.truetype(get_font(), 52)
+        font = get_truetype_font(52)
         draw = ImageDraw.ImageDraw(image)
         text_x1, text_y1, text_x2, text_y2 = draw.textbbox(
             (0, 0), caption, font=font, align="center"
@@ -678,6 +724,7 @@ class AnalysisDrawer(AnalysisProcessor):
                         file=self.file,
                         output_folder=temp_dir,
                         path_only=True,
+                        thread_count=get_pdf_render_thread_count(),
                     )
                 except Exception as ex:  # noqa: E722
                     print(
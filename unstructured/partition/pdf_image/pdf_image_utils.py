@@ -58,8 +58,12 @@ def convert_pdf_to_image(
     dpi: int = 200,
     output_folder: Optional[Union[str, PurePath]] = None,
     path_only: bool = False,
+    thread_count: int = 1,
 ) -> Union[List[Image.Image], List[str]]:
-    """Get the image renderings of the pdf pages using pdf2image"""
+    """Get the image renderings of the pdf pages using pdf2image
+
+    `thread_count` is the number of poppler processes pdf2image splits the pages between.
+    """
 
     if path_only and not output_folder:
         raise ValueError("output_folder must be specified if path_only is true")
@@ -71,6 +75,7 @@ def convert_pdf_to_image(
             dpi=dpi,
             output_folder=output_folder,
             paths_only=path_only,
+            thread_count=thread_count,
         )
     else:
         images = pdf2image.convert_from_path(
@@ -78,6 +83,7 @@ def convert_pdf_to_image(
             dpi=dpi,
             output_folder=output_folder,
             paths_only=path_only,
+            thread_count=thread_count,
         )
 
     return images
@@ -34,27 +34,11 @@ class OCRAgentGoogleVision(OCRAgent):
         return True
 
     def get_text_from_image(self, image: PILImage.Image) -> str:
-        image_context = ImageContext(language_hints=[self.language]) if self.language else None
-        with BytesIO() as buffer:
-            image.save(buffer, format="PNG")
-            response = self.client.document_text_detection(
-                image=Image(content=buffer.getvalue()), image_context=image_context
-            )
-        document = response.full_text_annotation
-        assert isinstance(document, TextAnnotation)
+        document = self._detect_document_text(image)
         return document.text
 
     def get_layout_from_image(self, image: PILImage.Image) -> list[TextRegion]:
-        trace_logger.detail("Processing entire page OCR with Google Vision API...")
-        image_context = ImageContext(language_hints=[self.language]) if self.language else None
-        with BytesIO() as buffer:
-            image.save(buffer, format="PNG")
-            response = self.client.document_text_detection(
-                image=Image(content=buffer.getvalue()), image_context=image_context
-            )
-        document = response.full_text_annotation
-        assert isinstance(document, TextAnnotation)
-        regions = self._parse_regions(document)
+        regions, _ = self._get_layout_and_text_from_image(image)
         return regions
 
     def get_layout_elements_from_image(self, image: PILImage.Image) -> list[LayoutElement]:
@@ -62,12 +46,9 @@ class OCRAgentGoogleVision(OCRAgent):
             build_layout_elements_from_ocr_regions,
         )
 
-        ocr_regions = self.get_layout_from_image(
-            image,
-        )
-        ocr_text = self.get_text_from_image(
-            image,
-        )
+        # -- both the regions and the full text come from the same annotation, so only send the
+        # -- image to the API once rather than once for each.
+        ocr_regions, ocr_text = self._get_layout_and_text_from_image(image)
         layout_elements = build_layout_elements_from_ocr_regions(
             ocr_regions=ocr_regions,
             ocr_text=ocr_text,
@@ -75,6 +56,26 @@ class OCRAgentGoogleVision(OCRAgent):
         )
         return layout_elements
 
+    def _get_layout_and_text_from_image(
+        self, image: PILImage.Image
+    ) -> tuple[list[TextRegion], str]:
+        """Get both the OCR regions and the full OCR text of `image` from a single API call."""
+        trace_logger.detail("Processing entire page OCR with Google Vision API...")
+        document = self._detect_document_text(image)
+        return self._parse_regions(document), document.text
+
+    def _detect_document_text(self, image: PILImage.Image) -> TextAnnotation:
+        """Send `image` to the Google Vision API and return the full text annotation."""
+        image_context = ImageContext(language_hints=[self.language]) if self.language else None
+        with BytesIO() as buffer:
+            image.save(buffer, format="PNG")
+            response = self.client.document_text_detection(
+                image=Image(content=buffer.getvalue()), image_context=image_context
+            )
+        document = response.full_text_annotation
+        assert isinstance(document, TextAnnotation)
+        return document
+
     def _parse_regions(self, ocr_data: TextAnnotation) -> list[TextRegion]:
         from unstructured.partition.pdf_image.inference_utils import build_text_region_from_coords
 
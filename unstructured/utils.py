@@ -3,13 +3,16 @@ from __future__ import annotations
 import asyncio
 import functools
 import importlib
+import importlib.util
 import inspect
 import json
 import os
 import platform
-import subprocess
+import shutil
+import sys
 import tempfile
 import threading
+import urllib.parse
 from functools import wraps
 from itertools import combinations
 from typing import (
@@ -77,15 +80,16 @@ class lazyproperty(Generic[_T]):
     cached and that same value returned on second and later access without re-evaluation of the
     method.
 
-    Like @property, this class produces a *data descriptor* object, which is stored in the __dict__
-    of the *class* under the name of the decorated method ('fget' nominally). The cached value is
-    stored in the __dict__ of the *instance* under that same name.
+    Unlike @property, this class produces a *non-data descriptor* object, which is stored in the
+    __dict__ of the *class* under the name of the decorated method ('fget' nominally). The cached
+    value is stored in the __dict__ of the *instance* under that same name.
 
-    Because it is a data descriptor (as opposed to a *non-data descriptor*), its `__get__()` method
-    is executed on each access of the decorated attribute; the __dict__ item of the same name is
-    "shadowed" by the descriptor.
+    Because it is a non-data descriptor, its `__get__()` method is only executed on first access
+    of the decorated attribute. Once the value is cached, the instance __dict__ item of the same
+    name takes precedence on attribute lookup and the descriptor is bypassed entirely, making
+    later access as fast as access to a plain instance attribute.
 
-    While this may represent a performance improvement over a property, its greater benefit may be
+    While this represents a performance improvement over a property, its greater benefit may be
     its other characteristics. One common use is to construct collaborator objects, removing that
     "real work" from the constructor, while still only executing once. It also de-couples client
     code from any sequencing considerations; if it's accessed from more than one location, it's
@@ -93,10 +97,11 @@ class lazyproperty(Generic[_T]):
 
     Loosely based on: https://stackoverflow.com/a/6849299/1902513.
 
-    A lazyproperty is read-only. There is no counterpart to the optional "setter" (or deleter)
-    behavior of an @property. This is critically important to maintaining its immutability and
-    idempotence guarantees. Attempting to assign to a lazyproperty raises AttributeError
-    unconditionally.
+    A lazyproperty is intended to be read-only. There is no counterpart to the optional "setter"
+    (or deleter) behavior of an @property. Note however that assignment is not actively prevented
+    (that would require a data descriptor, which is evaluated on every access); assigning to a
+    lazyproperty attribute overwrites the cached value and breaks its immutability and idempotence
+    guarantees, so don't do that.
 
     The parameter names in the methods below correspond to this usage example::
 
@@ -114,8 +119,9 @@ class lazyproperty(Generic[_T]):
     def __init__(self, fget: Callable[..., _T]) -> None:
         """*fget* is the decorated method (a "getter" function).
 
-        A lazyproperty is read-only, so there is only an *fget* function (a regular
-        @property can also have an fset and fdel function). This name was chosen for
+        A lazyproperty is intended to be read-only, so there is only an *fget* function (a
+        regular @property can also have an fset and fdel function). Note that assignment is not
+        prevented and silently overwrites the cached value. This name was chosen for
         consistency with Python's `property` class which uses this name for the
         corresponding parameter.
         """
@@ -126,8 +132,17 @@ class lazyproperty(Generic[_T]):
         # --- adopt fget's __name__, __doc__, and other attributes
         functools.update_wrapper(self, fget)  # pyright: ignore
 
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Called when the descriptor is assigned to a class attribute named *name*.
+
+        The cached value must be stored in the instance __dict__ under the name this descriptor
+        is bound to on the class (not necessarily the `__name__` of fget) for that __dict__ item
+        to shadow this descriptor on later access.
+        """
+        self._name = name
+
     def __get__(self, obj: Any, type: Any = None) -> _T:
-        """Called on each access of 'fget' attribute on class or instance.
+        """Called on first access of 'fget' attribute on an instance, or any access on the class.
 
         *self* is this instance of a lazyproperty descriptor "wrapping" the property
         method it decorates (`fget`, nominally).
@@ -144,37 +159,13 @@ class lazyproperty(Generic[_T]):
         if obj is None:
             return self  # type: ignore
 
-        # --- when accessed on instance, start by checking instance __dict__ for
-        # --- item with key matching the wrapped function's name
-        value = obj.__dict__.get(self._name)
-        if value is None:
-            # --- on first access, the __dict__ item will be absent. Evaluate fget()
-            # --- and store that value in the (otherwise unused) host-object
-            # --- __dict__ value of same name ('fget' nominally)
-            value = self._fget(obj)
-            obj.__dict__[self._name] = value
-        return cast(_T, value)
-
-    def __set__(self, obj: Any, value: Any) -> None:
-        """Raises unconditionally, to preserve read-only behavior.
-
-        This decorator is intended to implement immutable (and idempotent) object
-        attributes. For that reason, assignment to this property must be explicitly
-        prevented.
-
-        If this __set__ method was not present, this descriptor would become a
-        *non-data descriptor*. That would be nice because the cached value would be
-        accessed directly once set (__dict__ attrs have precedence over non-data
-        descriptors on instance attribute lookup). The problem is, there would be
-        nothing to stop assignment to the cached value, which would overwrite the result
-        of `fget()` and break both the immutability and idempotence guarantees of this
-        decorator.
-
-        The performance with this __set__() method in place was roughly 0.4 usec per
-        access when measured on a 2.8GHz development machine; so quite snappy and
-        probably not a rich target for optimization efforts.
-        """
-        raise AttributeError("can't set attribute")
+        # --- on first access on an instance, evaluate fget() and store that value in the host
+        # --- object __dict__ under the same name ('fget' nominally). Because this is a non-data
+        # --- descriptor, that __dict__ item is found first on all later access and this method
+        # --- is not called again.
+        value = self._fget(obj)
+        obj.__dict__[self._name] = value
+        return value
 
 
 def save_as_jsonl(data: list[dict[str, Any]], filename: str) -> None:
@@ -184,7 +175,7 @@ def save_as_jsonl(data: list[dict[str, Any]], filename: str) -> None:
 
 def read_from_jsonl(filename: str) -> list[dict[str, Any]]:
     with open(filename) as input_file:
-        return [json.loads(line) for line in input_file]
+        return [json.loads(line) for line in input_file if line.strip()]
 
 
 def requires_dependencies(
@@ -195,12 +186,14 @@ def requires_dependencies(
         dependencies = [dependencies]
 
     def decorator(func: Callable[_P, _T]) -> Callable[_P, _T]:
+        # -- resolved on first call of the decorated function and reused on every call after --
+        missing_deps: Optional[List[str]] = None
+
         def run_check():
-            missing_deps: List[str] = []
-            for dep in dependencies:
-                if not dependency_exists(dep):
-                    missing_deps.append(dep)
-            if len(missing_deps) > 0:
+            nonlocal missing_deps
+            if missing_deps is None:
+                missing_deps = [dep for dep in dependencies if not dependency_exists(dep)]
+            if missing_deps:
                 raise ImportError(
                     f"Following dependencies are missing: {', '.join(missing_deps)}. "
                     + (
@@ -227,14 +220,30 @@ def requires_dependencies(
     return decorator
 
 
-def dependency_exists(dependency: str):
+@functools.lru_cache(maxsize=None)
+def dependency_exists(dependency: str) -> bool:
+    """True when `dependency` is an installed, importable module.
+
+    For a top-level name like "unstructured_inference" the module is only located, not imported,
+    so this is cheap and free of import side-effects even for heavyweight packages. For a dotted
+    name like "a.b" the parent package "a" is imported (that is how `find_spec()` locates a
+    submodule), but "a.b" itself is not. The result is cached because installed packages don't
+    change during the life of the process.
+    """
     try:
-        importlib.import_module(dependency)
-    except ImportError as e:
-        # Check to make sure this isn't some unrelated import error.
-        if dependency in repr(e):
-            return False
-    return True
+        return importlib.util.find_spec(dependency) is not None
+    except (ImportError, ValueError):
+        # -- a dotted name whose parent package is missing raises ModuleNotFoundError; a module
+        # -- already in `sys.modules` without a `__spec__` raises ValueError.
+        return dependency in sys.modules
+
+
+_EMPTY_ITERABLE_MSG = (
+    "Expected at least 1 element in iterable from which to retrieve first, got empty iterable."
+)
+_MORE_THAN_ONE_MSG = (
+    "Expected only 1 element in passed argument, instead there are at least 2 elements."
+)
 
 
 def _first_and_remaining_iterator(it: Iterable[_T]) -> Tuple[_T, Iterator[_T]]:
@@ -242,15 +251,17 @@ def _first_and_remaining_iterator(it: Iterable[_T]) -> Tuple[_T, Iterator[_T]]:
     try:
         out = next(iterator)
     except StopIteration:
-        raise ValueError(
-            "Expected at least 1 element in iterable from which to retrieve first, got empty "
-            "iterable.",
-        )
+        raise ValueError(_EMPTY_ITERABLE_MSG)
     return out, iterator
 
 
 def first(it: Iterable[_T]) -> _T:
     """Returns the first item from an iterable. Raises an error if the iterable is empty."""
+    # -- fast path for sequences, which is how this is most commonly called --
+    if isinstance(it, (list, tuple)):
+        if not it:
+            raise ValueError(_EMPTY_ITERABLE_MSG)
+        return cast(_T, it[0])
     out, _ = _first_and_remaining_iterator(it)
     return out
 
@@ -260,53 +271,42 @@ def only(it: Iterable[Any]) -> Any:
 
     Raises an error if the iterable is not a singleton.
     """
+    # -- fast path for sequences, which is how this is most commonly called --
+    if isinstance(it, (list, tuple)):
+        if not it:
+            raise ValueError(_EMPTY_ITERABLE_MSG)
+        if len(it) > 1:
+            raise ValueError(_MORE_THAN_ONE_MSG)
+        return it[0]
     out, iterator = _first_and_remaining_iterator(it)
     if any(True for _ in iterator):
-        raise ValueError(
-            "Expected only 1 element in passed argument, instead there are at least 2 elements.",
-        )
+        raise ValueError(_MORE_THAN_ONE_MSG)
     return out
 
 
 def scarf_analytics():
-    try:
-        subprocess.check_output("nvidia-smi")
-        gpu_present = True
-    except Exception:
-        gpu_present = False
+    """Send anonymous usage telemetry unless opted out.
+
+    The request is made from a daemon thread so it never holds up the importing process.
+    """
+    if os.getenv("SCARF_NO_ANALYTICS") == "true" or os.getenv("DO_NOT_TRACK") == "true":
+        return
+    threading.Thread(target=_send_scarf_analytics, daemon=True).start()
 
-    python_version = ".".join(platform.python_version().split(".")[:2])
 
+def _send_scarf_analytics():
     try:
-        if os.getenv("SCARF_NO_ANALYTICS") != "true" and os.getenv("DO_NOT_TRACK") != "true":
-            if "dev" in __version__:
-                requests.get(
-                    "https://packages.unstructured.io/python-telemetry?version="
-                    + __version__
-                    + "&platform="
-                    + platform.system()
-                    + "&python"
-                    + python_version
-                    + "&arch="
-                    + platform.machine()
-                    + "&gpu="
-                    + str(gpu_present)
-                    + "&dev=true",
-                )
-            else:
-                requests.get(
-                    "https://packages.unstructured.io/python-telemetry?version="
-                    + __version__
-                    + "&platform="
-                    + platform.system()
-                    + "&python"
-                    + python_version
-                    + "&arch="
-                    + platform.machine()
-                    + "&gpu="
-                    + str(gpu_present)
-                    + "&dev=false",
-                )
+        query = urllib.parse.urlencode(
+            {
+                "version": __version__,
+                "platform": platform.system(),
+                "python": ".".join(platform.python_version().split(".")[:2]),
+                "arch": platform.machine(),
+                "gpu": str(shutil.which("nvidia-smi") is not None),
+                "dev": "true" if "dev" in __version__ else "false",
+            }
+        )
+        requests.get(f"https://packages.unstructured.io/python-telemetry?{query}", timeout=1.0)
     except Exception:
         pass
 